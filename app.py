@@ -1,32 +1,27 @@
 # app.py — CLI for lead-lab (script mode: run with `python app.py <command>`)
 # -----------------------------------------------------------------------------
 import argparse
+import importlib.util
 from datetime import date
 from typing import List
-import pandas as pd
 
 # Absolute imports (script mode)
 from config import settings
 from storage import init_store, add_rows, load_df
 from utils.logging_utils import log
-from enrich.site_meta import fetch_site_meta
 
-# Optional helpers (import if present)
-try:
-    from finders.finder import find_from_urls
-except Exception:
-    find_from_urls = None
+# Heavier modules (pandas, HTTP/HTML stacks, gspread) are imported inside the
+# commands that use them, and storage only pulls in pandas from load_df/save_df,
+# so e.g. `init` and `add` start without loading pandas.
 
-try:
-    from enrich.contact_enrich import enrich_contacts_for_df
-except Exception:
-    enrich_contacts_for_df = None
 
-# Sheets backend selection (MOCK by default; real Sheets if SHEETS_BACKEND=SHEETS)
-if settings.sheets_backend == "SHEETS":
-    from sheets.sheets_client import SheetsClient
-else:
-    from sheets.mock_sheets_client import SheetsClient
+def _sheets_client():
+    """Instantiate the configured backend (MOCK by default; real Sheets if SHEETS_BACKEND=SHEETS)."""
+    if settings.sheets_backend == "SHEETS":
+        from sheets.sheets_client import SheetsClient
+    else:
+        from sheets.mock_sheets_client import SheetsClient
+    return SheetsClient()
 
 
 # Example row used by interactive add
@@ -53,7 +48,7 @@ def cmd_init(_):
 
 
 def cmd_setup_sheets(_):
-    sc = SheetsClient()
+    sc = _sheets_client()
     if hasattr(sc, "setup_schema"):
         sc.setup_schema()
     if hasattr(sc, "ensure_buckets_tab"):
@@ -74,51 +69,70 @@ def cmd_add(_):
 
 
 def cmd_import(args):
+    import pandas as pd
+
     import_path = args.path
-    df = pd.read_csv(import_path, dtype=str).fillna("")
-    rows = df.to_dict(orient="records")
-    add_rows(rows)
+    # pyarrow's multithreaded CSV reader is much faster on big files (optional dependency).
+    engine = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+    df = pd.read_csv(import_path, dtype=str, engine=engine).fillna("")
+    cols = list(df.columns)
+    # Stream rows into add_rows instead of materializing a list of dicts.
+    add_rows(dict(zip(cols, r)) for r in df.itertuples(index=False, name=None))
 
 
 def cmd_enrich(_):
+    from enrich.site_meta import fetch_site_meta
+
     df = load_df()
-    updated = []
-    for _, r in df.iterrows():
-        notes = str(r.get("Notes", ""))
-        website = str(r.get("Website", "")).strip()
-        if website and (not notes or len(notes) < 5):
-            meta = fetch_site_meta(website)
-            title = meta.get("MetaTitle", "").strip()
-            if title:
-                r["Notes"] = (notes + f" | Title: {title}").strip(" |")
-                updated.append(r.to_dict())
+    mask = df["Website"].fillna("").astype(str).str.strip().ne("")
+    mask &= df["Notes"].fillna("").astype(str).str.len().lt(5)
+    candidates = df.loc[mask]
+    hits: List[int] = []
+    new_notes: List[str] = []
+    for pos, r in enumerate(candidates.itertuples(index=False)):
+        notes = str(getattr(r, "Notes", "") or "")
+        website = str(getattr(r, "Website", "") or "").strip()
+        meta = fetch_site_meta(website)
+        title = meta.get("MetaTitle", "").strip()
+        if title:
+            hits.append(pos)
+            new_notes.append((notes + f" | Title: {title}").strip(" |"))
+    # One frame-level assign + to_dict instead of a dict build per updated row.
+    updated = candidates.iloc[hits].assign(Notes=new_notes).to_dict("records") if hits else []
     if updated:
         add_rows(updated)
-        log.info(f"Enriched {len(updated)} rows with site titles")
+        log.info("Enriched %d rows with site titles", len(updated))
     else:
         log.info("No rows needed enrichment.")
 
 
 def cmd_enrich_contacts(args):
-    if enrich_contacts_for_df is None:
+    try:
+        from enrich.contact_enrich import enrich_contacts_for_df
+    except Exception:
         log.error("Contact enrichment module not available. Add enrich/contact_enrich.py first.")
         return
     df = load_df()
+    # Without --workers, enrich_contacts_for_df uses LEADLAB_SITE_WORKERS
+    extra = {"workers": args.workers} if args.workers else {}
     changed = enrich_contacts_for_df(
         df,
         limit=args.limit,
         delay=args.delay,
         only_blank=args.only_blank,
+        **extra,
     )
     if changed:
         add_rows(changed)
-        log.info(f"Contact enrichment updated {len(changed)} rows.")
+        log.info("Contact enrichment updated %d rows.", len(changed))
     else:
         log.info("No contacts found.")
 
 
 def cmd_find(args):
-    if find_from_urls is None:
+    try:
+        from finders.finder import find_from_urls
+    except Exception:
         log.error("Finder not available. Add finders/finder.py first.")
         return
     urls: List[str] = args.urls or []
@@ -131,7 +145,7 @@ def cmd_find(args):
     rows = find_from_urls(urls, topic=args.topic)
     if rows:
         add_rows(rows)
-        log.info(f"Finder added/updated {len(rows)} candidate leads from {len(urls)} URL(s).")
+        log.info("Finder added/updated %d candidate leads from %d URL(s).", len(rows), len(urls))
     else:
         log.info("Finder produced no candidates. Try different sources.")
 
@@ -139,7 +153,7 @@ def cmd_find(args):
 def cmd_export(_):
     df = load_df()
     rows = df.to_dict(orient="records")
-    sc = SheetsClient()
+    sc = _sheets_client()
     sc.upsert_rows(rows)
 
 
@@ -168,6 +182,7 @@ def build_parser():
     pec.add_argument("--limit", type=int, default=50, help="Max rows to process")
     pec.add_argument("--delay", type=float, default=0.5, help="Delay between page fetches (seconds)")
     pec.add_argument("--only-blank", action="store_true", help="Only fill rows with empty Email")
+    pec.add_argument("--workers", type=int, default=None, help="Sites to scan in parallel (default: LEADLAB_SITE_WORKERS)")
     pec.set_defaults(func=cmd_enrich_contacts)
 
     # Finder from list/article URLs (optional)
@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 from datetime import date
-from ..storage import load_df, add_rows
+from storage import load_df, add_rows
 
 st.set_page_config(page_title="Lead Lab", page_icon="🎯")
 
@@ -12,5 +12,6 @@ class Settings:
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     local_csv: str = os.getenv("LOCAL_CSV", "data/leads.csv")
     sheets_backend: str = os.getenv("SHEETS_BACKEND", "MOCK").upper()  # SHEETS or MOCK
+    cache_dir: str = os.getenv("LEADLAB_CACHE_DIR", ".cache")  # on-disk HTTP/scan caches
 
 settings = Settings()
\ No newline at end of file
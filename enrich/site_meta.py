@@ -1,7 +1,7 @@
 # enrich/site_meta.py
-import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urlparse
+from utils.http import get_text
 from utils.logging_utils import log   # ← changed: no leading dots
 
 HEADERS = {
@@ -16,22 +16,21 @@ def fetch_site_meta(url: str, timeout: int = 5) -> dict:
         return meta
 
     try:
-        r = requests.get(url, headers=HEADERS, timeout=timeout)
-        if not r.ok:
-            log.warning(f"fetch_site_meta: HTTP {r.status_code} for {url}")
+        status, html = get_text(url, headers=HEADERS, timeout=timeout)
+        if not 200 <= status < 300:
+            log.warning("fetch_site_meta: HTTP %s for %s", status, url)
             return meta
 
-        soup = BeautifulSoup(r.text, "html.parser")
-        title_tag = soup.find("title")
-        desc_tag = soup.find("meta", attrs={"name": "description"})
+        tree = LexborHTMLParser(html)
+        title_tag = tree.css_first("title")
+        desc_tag = tree.css_first('meta[name="description"]')
+        desc = desc_tag.attributes.get("content") if desc_tag else None
 
-        meta["MetaTitle"] = (title_tag.text.strip() if title_tag else "")[:200]
-        meta["MetaDescription"] = (
-            desc_tag["content"].strip() if desc_tag and desc_tag.get("content") else ""
-        )[:300]
+        meta["MetaTitle"] = (title_tag.text().strip() if title_tag else "")[:200]
+        meta["MetaDescription"] = (desc.strip() if desc else "")[:300]
         meta["Domain"] = urlparse(url).netloc
 
         return meta
     except Exception as e:
-        log.warning(f"fetch_site_meta: failed for {url} ({e})")
+        log.warning("fetch_site_meta: failed for %s (%s)", url, e)
         return meta
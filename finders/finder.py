@@ -1,18 +1,33 @@
 # finders/finder.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Set
 import re
-import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urlparse
+from utils.http import CONNECT_TIMEOUT, SESSION
 from utils.logging_utils import log
 
 USER_AGENT = "LeadLab/0.1 (+research-only; no outreach)"
+FINDER_WORKERS: int = int(os.getenv("LEADLAB_FINDER_WORKERS", "8"))  # list URLs fetched in parallel
 BLOCKED_DOMAINS: Set[str] = {
     "facebook.com","x.com","twitter.com","instagram.com","youtube.com",
     "tiktok.com","linkedin.com","pinterest.com","itunes.apple.com",
 }
 
+@lru_cache(maxsize=4096)  # the same hosts repeat across anchors and articles
 def _domain(url: str) -> str:
+    # Fast path for plain http(s) links (nearly every anchor we look at):
+    # slice out the netloc by hand instead of running the full urlparse.
+    scheme, sep, rest = url.partition("://")
+    if sep and scheme.lower() in ("http", "https") and not any(c in url for c in "\t\r\n[]"):
+        end = len(rest)
+        for ch in "/?#":
+            i = rest.find(ch, 0, end)
+            if i != -1:
+                end = i
+        return rest[:end].lower()
     try:
         return urlparse(url).netloc.lower()
     except Exception:
@@ -27,12 +42,12 @@ def _clean_name(text: str) -> str:
     return re.sub(r"\s+", " ", t)[:80]
 
 def extract_candidates_from_html(html: str, source_url: str) -> List[Dict]:
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
     src_dom = _domain(source_url)
     rows: List[Dict] = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        text = _clean_name(a.get_text(" "))
+    for a in tree.css("a[href]"):
+        href = (a.attributes.get("href") or "").strip()
+        text = _clean_name(a.text(separator=" "))
         if not text or len(text) < 2:    continue
         if not href.startswith("http"):  continue
         if not _looks_external(href, src_dom):  continue
@@ -46,21 +61,36 @@ def extract_candidates_from_html(html: str, source_url: str) -> List[Dict]:
 
 def extract_candidates_from_url(url: str) -> List[Dict]:
     try:
-        resp = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=12)
+        resp = SESSION.get(
+            url, headers={"User-Agent": USER_AGENT}, timeout=(CONNECT_TIMEOUT, 12), stream=False
+        )
         resp.raise_for_status()
         return extract_candidates_from_html(resp.text, url)
     except Exception as e:
-        log.warning(f"finder: failed {url} — {e}")
+        log.warning("finder: failed %s — %s", url, e)
         return []
 
 def find_from_urls(urls: List[str], topic: str = "podcast") -> List[Dict]:
     """Parse list/article URLs and return candidate lead rows. Review results."""
+    if not urls:
+        return []
+    category = "Podcast" if topic=="podcast" else ("Network" if topic=="network" else "Event")
+
+    # Each URL is an independent, I/O-bound fetch; results keep input order.
+    with ThreadPoolExecutor(max_workers=max(1, min(FINDER_WORKERS, len(urls)))) as pool:
+        per_url = list(pool.map(extract_candidates_from_url, urls))
+
+    # The same brand is often linked from several roundups (or twice in one).
+    seen: Set[tuple] = set()
     out: List[Dict] = []
-    for url in urls:
-        cand = extract_candidates_from_url(url)
+    for cand in per_url:
         for r in cand:
-            r.setdefault("Category", "Podcast" if topic=="podcast" else ("Network" if topic=="network" else "Event"))
+            key = (r["Company"].lower(), _domain(r["Website"]))
+            if key in seen:
+                continue
+            seen.add(key)
+            r.setdefault("Category", category)
             r.setdefault("ContactName",""); r.setdefault("Role",""); r.setdefault("Email","")
             r.setdefault("Notes",""); r.setdefault("Status","New")
-        out.extend(cand)
+            out.append(r)
     return out
@@ -1,6 +1,6 @@
 # models.py
 # -----------------------------------------------------------------------------
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from datetime import date
 from typing import Optional, Dict, Any
 import re
@@ -32,11 +32,12 @@ class Lead:
     SourceURL: Optional[str] = ""
     Notes: Optional[str] = ""
     Status: Optional[str] = "New"       # Client-maintained downstream
-    DateAdded: Optional[str] = date.today().isoformat()
+    DateAdded: Optional[str] = field(default_factory=lambda: date.today().isoformat())
     Key: Optional[str] = ""             # Deterministic dedupe key
 
     def to_row(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat string fields: skip asdict()'s recursive copy.deepcopy per value
+        return {k: getattr(self, k) for k in _FIELDS}
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Lead":
@@ -54,7 +55,8 @@ class Lead:
         if status not in VALID_STATUSES:
             status = "New"
 
-        d = norm.get("DateAdded") or date.today().isoformat()
+        # Blank/missing dates fall through to the DateAdded default_factory
+        dated = {"DateAdded": norm["DateAdded"]} if norm.get("DateAdded") else {}
 
         return Lead(
             Company=norm.get("Company", "").strip(),
@@ -67,6 +69,10 @@ class Lead:
             SourceURL=norm.get("SourceURL", "").strip(),
             Notes=norm.get("Notes", "").strip(),
             Status=status,
-            DateAdded=d,
             Key=norm.get("Key", "").strip(),
+            **dated,
         )
+
+
+# Field names in declaration order, for Lead.to_row
+_FIELDS = tuple(f.name for f in fields(Lead))
@@ -4,10 +4,6 @@
 # ---------------------------------------------------------------------
 import gspread
 from google.oauth2.service_account import Credentials
-from gspread_formatting import (
-    set_frozen, set_column_width, cellFormat, textFormat,
-    DataValidationRule, BooleanCondition, set_data_validation_for_cell_range,
-)
 from typing import List, Dict
 from config import settings               # ← absolute
 from utils.logging_utils import log       # ← absolute
@@ -46,22 +42,33 @@ class SheetsClient:
         try:
             return self.sh.worksheet(name)
         except gspread.WorksheetNotFound:
-            log.info(f"Creating worksheet '{name}'")
+            log.info("Creating worksheet '%s'", name)
             return self.sh.add_worksheet(title=name, rows=1000, cols=20)
 
     def setup_schema(self):
-        """Ensure header, column widths, frozen rows, and dropdowns."""
+        """Ensure header, column widths, frozen rows, and dropdowns.
+
+        Everything is sent as one spreadsheets.batchUpdate; the _Validation
+        lists are only rewritten when they differ from what the tab holds.
+        """
         header = self.ws.row_values(1)
+        requests: List[Dict] = []
         if not header:
-            self.ws.update([LEAD_HEADER])
+            header = list(LEAD_HEADER)
+            requests.append(self._cells_request(self.ws.id, 0, 0, [header]))
         else:
             missing = [h for h in LEAD_HEADER if h not in header]
             if missing:
                 header += missing
-                self.ws.update([header])
+                requests.append(self._cells_request(self.ws.id, 0, 0, [header]))
 
         # Freeze header row
-        set_frozen(self.ws, rows=1)
+        requests.append({
+            "updateSheetProperties": {
+                "properties": {"sheetId": self.ws.id, "gridProperties": {"frozenRowCount": 1}},
+                "fields": "gridProperties.frozenRowCount",
+            }
+        })
 
         # Column widths
         widths = {
@@ -69,39 +76,92 @@ class SheetsClient:
             7: 320, 8: 260, 9: 280, 10: 160, 11: 120, 12: 200,
         }
         for col, w in widths.items():
-            set_column_width(self.ws, col, w)
+            requests.append({
+                "updateDimensionProperties": {
+                    "range": {"sheetId": self.ws.id, "dimension": "COLUMNS",
+                              "startIndex": col - 1, "endIndex": col},
+                    "properties": {"pixelSize": w},
+                    "fields": "pixelSize",
+                }
+            })
 
         # Bold header row
-        fmt = cellFormat(textFormat=textFormat(bold=True))
-        self.ws.format("1:1", fmt)
+        requests.append({
+            "repeatCell": {
+                "range": {"sheetId": self.ws.id, "startRowIndex": 0, "endRowIndex": 1},
+                "cell": {"userEnteredFormat": {"textFormat": {"bold": True}}},
+                "fields": "userEnteredFormat.textFormat.bold",
+            }
+        })
 
-        # Add validation lists
+        # Add validation lists (fresh tabs are empty, so skip reading them)
+        status_col_vals = ["Status", *STATUS_LIST]
+        cat_col_vals = ["Category", *CATEGORY_LIST]
+        n = max(len(status_col_vals), len(cat_col_vals))
+        wanted = [
+            [a, b] for a, b in zip(
+                status_col_vals + [""] * (n - len(status_col_vals)),
+                cat_col_vals + [""] * (n - len(cat_col_vals)),
+            )
+        ]
         try:
             vtab = self.sh.worksheet("_Validation")
+            current = vtab.get(f"A1:B{n}")
         except gspread.WorksheetNotFound:
             vtab = self.sh.add_worksheet(title="_Validation", rows=10, cols=5)
+            current = []
 
-        vtab.update("A1", [["Status"], *[[s] for s in STATUS_LIST]])
-        vtab.update("B1", [["Category"], *[[c] for c in CATEGORY_LIST]])
+        # The API trims trailing blanks, so compare trimmed rows
+        if [self._rstrip_row(r) for r in current] != [self._rstrip_row(r) for r in wanted]:
+            requests.append(self._cells_request(vtab.id, 0, 0, [[v] for v in status_col_vals]))
+            requests.append(self._cells_request(vtab.id, 0, 1, [[v] for v in cat_col_vals]))
 
         status_range = f"_Validation!A2:A{1 + len(STATUS_LIST)}"
         cat_range = f"_Validation!B2:B{1 + len(CATEGORY_LIST)}"
 
-        header = self.ws.row_values(1)
         status_col = header.index("Status") + 1
         cat_col = header.index("Category") + 1
 
-        self._apply_dropdown_validation(status_col, status_range)
-        self._apply_dropdown_validation(cat_col, cat_range)
+        requests.append(self._dropdown_request(self.ws.id, status_col, status_range))
+        requests.append(self._dropdown_request(self.ws.id, cat_col, cat_range))
+
+        self.sh.batch_update({"requests": requests})
         log.info("Sheet schema & validations configured.")
 
-    def _apply_dropdown_validation(self, col_idx: int, list_a1: str):
-        rng = f"{gutils.rowcol_to_a1(2, col_idx)}:{gutils.rowcol_to_a1(10000, col_idx)}"
-        rule = DataValidationRule(
-            BooleanCondition("ONE_OF_RANGE", [list_a1]),
-            showCustomUi=True,
-        )
-        set_data_validation_for_cell_range(self.ws, rng, rule)
+    @staticmethod
+    def _rstrip_row(row: List[str]) -> List[str]:
+        row = list(row)
+        while row and row[-1] == "":
+            row.pop()
+        return row
+
+    @staticmethod
+    def _cells_request(sheet_id: int, row: int, col: int, values: List[List[str]]) -> Dict:
+        """updateCells request writing `values` as raw strings from (row, col), 0-based."""
+        return {
+            "updateCells": {
+                "start": {"sheetId": sheet_id, "rowIndex": row, "columnIndex": col},
+                "rows": [
+                    {"values": [{"userEnteredValue": {"stringValue": str(v)}} for v in r]}
+                    for r in values
+                ],
+                "fields": "userEnteredValue",
+            }
+        }
+
+    @staticmethod
+    def _dropdown_request(sheet_id: int, col_idx: int, list_a1: str) -> Dict:
+        """setDataValidation request: dropdown from `list_a1` on rows 2..10000 of column `col_idx`."""
+        return {
+            "setDataValidation": {
+                "range": {"sheetId": sheet_id, "startRowIndex": 1, "endRowIndex": 10000,
+                          "startColumnIndex": col_idx - 1, "endColumnIndex": col_idx},
+                "rule": {
+                    "condition": {"type": "ONE_OF_RANGE", "values": [{"userEnteredValue": list_a1}]},
+                    "showCustomUi": True,
+                },
+            }
+        }
 
     def ensure_buckets_tab(self):
         """Create/update Buckets tab with summary formulas."""
@@ -142,34 +202,59 @@ class SheetsClient:
             log.info("No rows to export.")
             return
 
-        header = self.ws.row_values(1)
-        if not header:
-            header = LEAD_HEADER
-            self.ws.update([header])
-
-        header_map = {h: i for i, h in enumerate(header)}
-        existing = self.ws.get_all_records()
-        index = {str(r.get(key_col, "")): i + 2 for i, r in enumerate(existing)}
+        # One read gives both the header and the existing keys.
+        all_values = self.ws.get_all_values()
+        header = list(all_values[0]) if all_values else []
 
-        # Ensure all columns exist
-        for k in LEAD_HEADER:
-            if k not in header_map:
-                header.append(k)
-                header_map[k] = len(header_map)
-        if header != self.ws.row_values(1):
+        # Ensure all columns exist (a single header write, only if something is missing)
+        missing = [h for h in LEAD_HEADER if h not in header]
+        if missing:
+            header += missing
             self.ws.update([header])
 
-        # Upsert logic
+        index: Dict[str, int] = {}
+        if key_col in header:
+            key_idx = header.index(key_col)
+            index = {
+                (r[key_idx] if key_idx < len(r) else ""): i + 2
+                for i, r in enumerate(all_values[1:])
+            }
+
+        # Upsert logic: collect everything first, then write in (at most) two API calls
+        updates: Dict[int, List] = {}
+        new_rows: List[List] = []
         for row in rows:
             values = [row.get(h, "") for h in header]
             key = str(row.get(key_col, ""))
             if key in index:
-                rownum = index[key]
-                rng = gutils.rowcol_to_a1(rownum, 1) + ":" + gutils.rowcol_to_a1(
-                    rownum, len(header)
-                )
-                self.ws.update(rng, [values], value_input_option="RAW")
+                updates[index[key]] = values  # last write wins for repeated keys
             else:
-                self.ws.append_rows([values], value_input_option="RAW")
+                new_rows.append(values)
+
+        if updates:
+            self.ws.batch_update(
+                self._contiguous_ranges(updates, len(header)), value_input_option="RAW"
+            )
+        if new_rows:
+            self.ws.append_rows(new_rows, value_input_option="RAW")
+
+        log.info("Exported %d rows to Google Sheets → %s", len(rows), settings.worksheet_name)
+
+    @staticmethod
+    def _contiguous_ranges(updates: Dict[int, List], width: int) -> List[Dict]:
+        """Group {rownum: values} into one A1 range per run of consecutive rows."""
+        data: List[Dict] = []
+        run: List[int] = []
+        for rownum in sorted(updates):
+            if run and rownum != run[-1] + 1:
+                data.append(SheetsClient._range_for(run, updates, width))
+                run = []
+            run.append(rownum)
+        if run:
+            data.append(SheetsClient._range_for(run, updates, width))
+        return data
 
-        log.info(f"Exported {len(rows)} rows to Google Sheets → {settings.worksheet_name}")
+    @staticmethod
+    def _range_for(run: List[int], updates: Dict[int, List], width: int) -> Dict:
+        rng = gutils.rowcol_to_a1(run[0], 1) + ":" + gutils.rowcol_to_a1(run[-1], width)
+        return {"range": rng, "values": [updates[r] for r in run]}
@@ -1,75 +1,210 @@
 # storage.py
 # -----------------------------------------------------------------------------
+import csv
 import os
-from typing import List, Dict
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import chain
+from typing import TYPE_CHECKING, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import date
-import pandas as pd
-from pandas.errors import EmptyDataError
 
 from config import settings
-from utils.validation import validate_row
+from utils.validation import validate_rows
 from utils.dedupe import compute_key
 from utils.logging_utils import log
-from utils.normalize import company_key  # requires utils/normalize.py
+from utils.normalize import company_key, company_keys  # requires utils/normalize.py
+
+# pandas is only needed by the DataFrame helpers (load_df/save_df) and is imported
+# there; add_rows runs on the csv module, so `init`/`add` never pay for it.
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Canonical schema (removed ContactName, Role)
 COLUMNS = [
     "Company", "CompanyKey", "Website", "Email", "ContactFormURL",
     "Category", "WhyFit", "SourceURL", "Notes", "Status", "DateAdded", "Key"
 ]
+_COL = {c: i for i, c in enumerate(COLUMNS)}
 
 # Ensure data directory exists
 os.makedirs("data", exist_ok=True)
 
+# Inside batch_writes(): nesting depth and the rows waiting to be flushed
+_batch_depth = 0
+_pending: Optional[List[List]] = None
+
 
 def init_store():
     """Create the canonical CSV with headers if it doesn't exist."""
     if not os.path.exists(settings.local_csv):
-        pd.DataFrame(columns=COLUMNS).to_csv(settings.local_csv, index=False)
-        log.info(f"Initialized {settings.local_csv}")
+        _write_file([])
+        log.info("Initialized %s", settings.local_csv)
     else:
-        log.info(f"Store already exists: {settings.local_csv}")
+        log.info("Store already exists: %s", settings.local_csv)
+
+
+def _backfill_company_key(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Fill blank CompanyKey cells from Company (in place)."""
+    # Columns are already str (dtype=str, na_filter=False); compare the raw arrays
+    mask_ck = (df["Company"].values != "") & (df["CompanyKey"].values == "")
+    if mask_ck.any():
+        df.loc[mask_ck, "CompanyKey"] = company_keys(df.loc[mask_ck, "Company"])
+    return df
 
 
-def _ensure_columns(df: pd.DataFrame) -> pd.DataFrame:
+def _ensure_columns(df: "pd.DataFrame") -> "pd.DataFrame":
     """Ensure all required columns exist and backfill computed ones."""
     for c in COLUMNS:
         if c not in df.columns:
             df[c] = ""
-    # Backfill CompanyKey where missing
-    if "CompanyKey" in df.columns and "Company" in df.columns:
-        mask_ck = (df["Company"].astype(str) != "") & (df["CompanyKey"].astype(str) == "")
-        if mask_ck.any():
-            df.loc[mask_ck, "CompanyKey"] = df.loc[mask_ck, "Company"].apply(company_key)
+    _backfill_company_key(df)
     # Return only canonical columns (drops deprecated ContactName/Role if present)
     return df[COLUMNS]
 
 
-def load_df() -> pd.DataFrame:
+def _read_header() -> List[str]:
+    """First line of the store, parsed as CSV ([] for an empty file)."""
+    with open(settings.local_csv, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def load_df() -> "pd.DataFrame":
     """Load the canonical CSV, ensuring required columns exist (auto-repair empties)."""
+    import pandas as pd
+    from pandas.errors import EmptyDataError
+
+    if _pending is not None:  # unflushed batch
+        return pd.DataFrame(_pending, columns=COLUMNS)
     if not os.path.exists(settings.local_csv):
         init_store()
+    # na_filter=False keeps blanks as "" (no NA scan, no fillna copy)
+    read = dict(dtype=str, engine="c", na_filter=False, keep_default_na=False)
+    if _read_header() == COLUMNS:
+        # Already canonical (the usual case): no column adds or reordering needed
+        return _backfill_company_key(pd.read_csv(settings.local_csv, **read))
     try:
-        df = pd.read_csv(settings.local_csv, dtype=str).fillna("")
+        # Unknown columns are dropped by the parser instead of after the fact
+        df = pd.read_csv(settings.local_csv, usecols=lambda c: c in _COL, **read)
     except EmptyDataError:
         # File exists but has no header/rows: recreate with headers
-        pd.DataFrame(columns=COLUMNS).to_csv(settings.local_csv, index=False)
+        _write_file([])
         df = pd.DataFrame(columns=COLUMNS)
     return _ensure_columns(df)
 
 
-def save_df(df: pd.DataFrame):
+def save_df(df: "pd.DataFrame"):
     """Persist the dataframe back to the canonical CSV."""
-    _ensure_columns(df).to_csv(settings.local_csv, index=False)
-    log.info(f"Saved {len(df)} rows to {settings.local_csv}")
+    _write_rows(_ensure_columns(df).fillna("").values.tolist())
+    log.info("Saved %d rows to %s", len(df), settings.local_csv)
+
+
+def _read_rows() -> List[List[str]]:
+    """Read the canonical CSV as rows of strings in COLUMNS order (no pandas).
+
+    Missing columns come back as "", unknown ones are dropped and CompanyKey
+    is backfilled, mirroring what load_df does for DataFrames.
+    """
+    if _pending is not None:  # unflushed batch; copies keep a failed add_rows from leaking edits
+        return [list(r) for r in _pending]
+    if not os.path.exists(settings.local_csv):
+        init_store()
+    with open(settings.local_csv, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        pos = {c: i for i, c in enumerate(header)}
+        src = [pos.get(c) for c in COLUMNS]
+        width = len(header)
+        rows = []
+        for r in reader:
+            if not r:  # blank line
+                continue
+            if len(r) < width:
+                r += [""] * (width - len(r))
+            rows.append([r[i] if i is not None else "" for i in src])
+    ci, cki = _COL["Company"], _COL["CompanyKey"]
+    for r in rows:
+        if r[ci] and not r[cki]:
+            r[cki] = company_key(r[ci])
+    return rows
+
+
+def _write_rows(rows: List[List]):
+    """Write rows (already in COLUMNS order); inside batch_writes() just keep them."""
+    global _pending
+    if _batch_depth:
+        _pending = rows
+    else:
+        _write_file(rows)
+
+
+def _write_file(rows: List[List]):
+    """Write the store to a sibling .tmp and rename it over the CSV.
+
+    A crash mid-write leaves the previous version intact.
+    """
+    tmp = settings.local_csv + ".tmp"
+    with open(tmp, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(COLUMNS)
+        w.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, settings.local_csv)
+
+
+@contextmanager
+def batch_writes():
+    """Defer store writes until the block exits, then write once.
+
+        with storage.batch_writes():
+            for chunk in chunks:
+                add_rows(chunk)
+
+    Reads inside the block see the pending rows. Whatever was saved before an
+    exception is still flushed.
+    """
+    global _batch_depth, _pending
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth and _pending is not None:
+            rows, _pending = _pending, None
+            _write_file(rows)
+
 
+def _build_index(rows: List[List[str]]) -> Tuple[DefaultDict[str, Set[int]], DefaultDict[str, Set[int]]]:
+    """Map Key and CompanyKey to row positions (multimaps: the CSV may hold duplicates)."""
+    by_key: DefaultDict[str, Set[int]] = defaultdict(set)
+    by_ck: DefaultDict[str, Set[int]] = defaultdict(set)
+    ki, cki = _COL["Key"], _COL["CompanyKey"]
+    for pos, r in enumerate(rows):
+        key, ck = r[ki], r[cki]
+        by_key[key].add(pos)
+        by_ck[ck].add(pos)
+    return by_key, by_ck
 
-def upsert_row(df: pd.DataFrame, row: Dict) -> pd.DataFrame:
+
+def upsert_row(
+    rows: List[List],
+    row: Dict,
+    by_key: DefaultDict[str, Set[int]],
+    by_ck: DefaultDict[str, Set[int]],
+    dropped: Set[int],
+) -> str:
     """
     Insert new row or update existing one.
     Priority merge keys:
       1) Key (stable hash of Company|Website|Email)
       2) CompanyKey (normalized company name) to prevent duplicates by company
+
+    Matches are O(1) lookups in the `by_key` / `by_ck` indexes (see _build_index).
+    `rows` is the store as lists in COLUMNS order: updates edit a row in place and
+    inserts are appended. Extra matches are collapsed into the first by adding
+    them to `dropped`; the caller filters those out before writing.
+    Returns "insert", "update", or "unchanged" when the match already held
+    every non-empty value (nothing to write unless duplicates were collapsed).
     """
     # Compute keys for the incoming row
     row["CompanyKey"] = row.get("CompanyKey") or company_key(row.get("Company", ""))
@@ -78,38 +213,60 @@ def upsert_row(df: pd.DataFrame, row: Dict) -> pd.DataFrame:
     key = row["Key"]
     ck = row["CompanyKey"]
 
-    mask_key = (df["Key"] == key) if key else pd.Series(False, index=df.index)
-    mask_co = (df["CompanyKey"] == ck) if ck else pd.Series(False, index=df.index)
-
-    if mask_key.any() or mask_co.any():
-        idx = df.index[mask_key | mask_co]
-        i0 = idx[0]  # update the first match
-        for k, v in row.items():
-            if k in df.columns and str(v) != "":
-                df.at[i0, k] = v
-        # If multiple duplicates exist for the same company, collapse them
-        if len(idx) > 1:
-            df = df.drop(index=idx[1:])
-        log.info(f"Upsert merge → {row.get('Company','(unknown)')} [{ck}]")
-    else:
-        df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
-        log.info(f"Inserted: {row.get('Company','(unknown)')} ({ck})")
+    hits: Set[int] = set()
+    if key:
+        hits |= by_key.get(key, set())
+    if ck:
+        hits |= by_ck.get(ck, set())
+    hits -= dropped
 
-    return df
+    if not hits:
+        pos = len(rows)
+        rows.append([row.get(c, "") for c in COLUMNS])
+        by_key[key].add(pos)
+        by_ck[ck].add(pos)
+        log.debug("Inserted: %s (%s)", row.get("Company", "(unknown)"), ck)
+        return "insert"
+
+    i0, *rest = sorted(hits)  # update the first match
+    # If multiple duplicates exist for the same company, collapse them
+    dropped.update(rest)
+    target = rows[i0]
+    changed = bool(rest)
+    for k, v in row.items():
+        if k not in _COL or str(v) == "":
+            continue
+        old = target[_COL[k]]
+        if str(v) == str(old):
+            continue
+        target[_COL[k]] = v
+        changed = True
+        # Keep the indexes in step when a merge rewrites a key
+        if k in ("Key", "CompanyKey") and old != v:
+            index = by_key if k == "Key" else by_ck
+            index[old].discard(i0)
+            index[v].add(i0)
+    log.debug("Upsert merge → %s [%s]", row.get("Company", "(unknown)"), ck)
+    return "update" if changed else "unchanged"
 
 
-def add_rows(rows: List[Dict]):
-    """Validate, stamp, compute keys, dedupe/merge, and persist a list of rows."""
-    df = load_df()
+def add_rows(rows: Iterable[Dict]):
+    """Validate, stamp, compute keys, dedupe/merge, and persist rows (any iterable of dicts)."""
+    # Peek so empty input skips the store read without materializing `rows`
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
+        log.info("add_rows: no rows")
+        return
+
+    store = _read_rows()
+    by_key, by_ck = _build_index(store)
+    dropped: Set[int] = set()
     inserted = 0
     updated = 0
+    dirty = False
 
-    for raw in rows:
-        ok, msg = validate_row(raw)
-        if not ok:
-            log.warning(f"Skipping invalid row: {msg} — {raw}")
-            continue
-
+    for _, raw in validate_rows(chain((first,), it)):
         # Defaults
         if not raw.get("DateAdded"):
             raw["DateAdded"] = date.today().isoformat()
@@ -118,12 +275,21 @@ def add_rows(rows: List[Dict]):
         raw["CompanyKey"] = raw.get("CompanyKey") or company_key(raw.get("Company", ""))
         raw["Key"] = raw.get("Key") or compute_key(raw)
 
-        before = len(df)
-        df = upsert_row(df, raw)
-        if len(df) > before:
+        outcome = upsert_row(store, raw, by_key, by_ck, dropped)
+        if outcome == "insert":
             inserted += 1
         else:
             updated += 1
+        dirty = dirty or outcome != "unchanged"
+
+    if not dirty:
+        log.info("add_rows: no-op")
+        return
+
+    # Collapse merged duplicates
+    if dropped:
+        store = [r for i, r in enumerate(store) if i not in dropped]
 
-    save_df(df)
-    log.info(f"Add complete — inserted: {inserted}, updated: {updated}")
+    _write_rows(store)
+    log.info("Saved %d rows to %s", len(store), settings.local_csv)
+    log.info("Add complete — inserted: %d, updated: %d", inserted, updated)
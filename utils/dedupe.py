@@ -2,18 +2,32 @@
 # File: utils/dedupe.py
 # -----------------------------------------------------------------------------
 import hashlib
+import os
+from functools import lru_cache
 from typing import Dict
 
+import xxhash
+
 # Deterministic key based on stable identifying fields
 KEY_FIELDS = ["Company", "Website", "Email"]
 
+# "sha1" reproduces Key values written before the switch to xxHash3
+KEY_HASH: str = os.getenv("LEADLAB_HASH", "xxh3").lower()
+
 
 def compute_key(row: Dict) -> str:
     """Compute a short deterministic hash key for a lead row.
 
     Uses the lowercased and trimmed values of Company, Website, and Email.
-    Returns the first 16 characters of a SHA1 hash, sufficient for uniqueness
-    in small datasets.
+    Returns the 16 hex characters of a 64-bit xxHash3, sufficient for uniqueness
+    in small datasets. Set LEADLAB_HASH=sha1 to get the legacy SHA1 prefix.
     """
-    base = "|".join((str(row.get(k, "")).strip().lower() for k in KEY_FIELDS))
-    return hashlib.sha1(base.encode("utf-8")).hexdigest()[:16]
+    return _compute_key_str(*(str(row.get(k, "")).strip().lower() for k in KEY_FIELDS))
+
+
+@lru_cache(maxsize=100_000)  # the same company shows up across many scraper hits
+def _compute_key_str(company: str, website: str, email: str) -> str:
+    base = "|".join((company, website, email))
+    if KEY_HASH == "sha1":
+        return hashlib.sha1(base.encode("utf-8")).hexdigest()[:16]
+    return xxhash.xxh3_64_hexdigest(base.encode("utf-8"))[:16]
@@ -0,0 +1,98 @@
+# utils/http.py
+# -----------------------------------------------------------------------------
+# Shared HTTP session for all outbound fetches (contacts, site meta, finder).
+# One pooled Session keeps connections alive, so repeated requests to the same
+# host reuse the TCP/TLS connection instead of handshaking every time.
+# Page bodies are revalidated with conditional GETs (ETag / Last-Modified)
+# and read in capped chunks so a single huge page can't dominate a run.
+# -----------------------------------------------------------------------------
+import os
+from typing import Dict, Optional, Tuple
+
+import diskcache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import settings
+
+# Read timeouts stay per caller; the connect timeout is shared.
+CONNECT_TIMEOUT: float = float(os.getenv("LEADLAB_CONNECT_TIMEOUT", "3.05"))
+PAGE_CACHE_TTL: float = float(os.getenv("LEADLAB_PAGE_CACHE_TTL", str(30 * 86400)))  # seconds
+MAX_BODY_BYTES: int = int(os.getenv("LEADLAB_MAX_BODY_BYTES", str(512 * 1024)))  # plenty for contacts
+
+# url -> {"etag", "last_mod", "html"} for pages that can be revalidated
+_PAGE_CACHE = diskcache.Cache(os.path.join(settings.cache_dir, "pages"), size_limit=2**30)
+
+
+def _build_session() -> requests.Session:
+    """Session with a pool sized for the enrichment thread pools (sites × pages)."""
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,  # hand back the last response; callers check .ok
+    )
+    adapter = HTTPAdapter(pool_connections=64, pool_maxsize=128, max_retries=retry)
+    s = requests.Session()
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+SESSION = _build_session()
+
+
+def _read_capped(r: requests.Response) -> str:
+    """Read at most MAX_BODY_BYTES of a streamed response and decode it."""
+    chunks = []
+    total = 0
+    for chunk in r.iter_content(64 * 1024):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= MAX_BODY_BYTES:
+            break
+    body = b"".join(chunks)[:MAX_BODY_BYTES]
+    try:
+        return body.decode(r.encoding or "utf-8", errors="replace")
+    except LookupError:  # bogus charset in Content-Type
+        return body.decode("utf-8", errors="replace")
+
+
+def get_text(
+    url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 5
+) -> Tuple[int, str]:
+    """GET `url` and return (status, body); the body is "" for non-2xx or non-HTML responses.
+
+    Bodies are truncated to MAX_BODY_BYTES. Responses carrying an ETag or
+    Last-Modified are cached. Later calls send If-None-Match /
+    If-Modified-Since, and a 304 reuses the cached body.
+    Network errors propagate to the caller.
+    """
+    cached = _PAGE_CACHE.get(url)
+    req_headers = dict(headers or {})
+    if cached:
+        if cached.get("etag"):
+            req_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_mod"):
+            req_headers["If-Modified-Since"] = cached["last_mod"]
+
+    with SESSION.get(
+        url, headers=req_headers, timeout=(CONNECT_TIMEOUT, timeout), stream=True
+    ) as r:
+        if r.status_code == 304 and cached:
+            return 200, cached["html"]
+        if not r.ok:
+            return r.status_code, ""
+        # PDFs, images, feeds etc. are never worth downloading for contact discovery.
+        ctype = r.headers.get("Content-Type", "").lower()
+        if ctype and "html" not in ctype:
+            return r.status_code, ""
+        html = _read_capped(r)
+        etag, last_mod = r.headers.get("ETag"), r.headers.get("Last-Modified")
+
+    if etag or last_mod:
+        _PAGE_CACHE.set(
+            url, {"etag": etag, "last_mod": last_mod, "html": html}, expire=PAGE_CACHE_TTL
+        )
+    return r.status_code, html
@@ -3,6 +3,7 @@
 # -----------------------------------------------------------------------------
 import logging
 import os
+from logging.handlers import MemoryHandler, RotatingFileHandler
 
 # Ensure the logs directory exists
 os.makedirs("logs", exist_ok=True)
@@ -10,6 +11,40 @@ os.makedirs("logs", exist_ok=True)
 _DEF_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
 
 
+class _BatchRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that writes into a buffered stream and leaves the
+    flush and the size check to flush_batch(), instead of doing them per record."""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding,
+                    errors=self.errors, buffering=64 * 1024)
+
+    def shouldRollover(self, record) -> bool:
+        return False  # checked once per batch in flush_batch()
+
+    def flush(self):
+        pass  # StreamHandler.emit flushes after every record; wait for the batch
+
+    def flush_batch(self):
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.flush()
+                if self.maxBytes > 0 and self.stream.tell() >= self.maxBytes:
+                    self.doRollover()
+        finally:
+            self.release()
+
+
+class _BatchMemoryHandler(MemoryHandler):
+    """MemoryHandler that flushes its target's stream once per batch."""
+
+    def flush(self):
+        super().flush()
+        if self.target:
+            self.target.flush_batch()
+
+
 def get_logger(name: str = "lead_lab") -> logging.Logger:
     """Return a configured logger. Avoids duplicate handlers on repeated imports."""
     logger = logging.getLogger(name)
@@ -18,12 +53,16 @@ def get_logger(name: str = "lead_lab") -> logging.Logger:
         logger.setLevel(level)
 
         fmt = logging.Formatter(_DEF_FORMAT)
-        fh = logging.FileHandler("logs/lead_lab.log")
+        rfh = _BatchRotatingFileHandler("logs/lead_lab.log", maxBytes=10_000_000, backupCount=3)
         ch = logging.StreamHandler()
 
-        fh.setFormatter(fmt)
+        rfh.setFormatter(fmt)
         ch.setFormatter(fmt)
 
+        # Buffer file writes: written out in one go every 1024 records, on ERROR,
+        # and at exit; rollover is checked at those points too
+        fh = _BatchMemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=rfh)
+
         logger.addHandler(fh)
         logger.addHandler(ch)
 
@@ -32,10 +71,3 @@ def get_logger(name: str = "lead_lab") -> logging.Logger:
 
 # Module-level logger used throughout the project
 log = get_logger()
-
-
-
-
-
-# Module-level logger used across the project
-log = get_logger()
\ No newline at end of file
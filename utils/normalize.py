@@ -1,23 +1,47 @@
 # utils/normalize.py
 import re
 import unicodedata
+from functools import lru_cache
 
 # Common legal suffixes to drop from the tail
-_SUFFIXES = {
+_SUFFIXES = frozenset({
     "inc","inc.","llc","l.l.c.","co","co.","company","corp","corp.","corporation",
     "ltd","ltd.","plc","gmbh","sa","s.a.","bv","b.v."
-}
+})
+_STOP = frozenset({"the"})
+
+_PUNCT_RE = re.compile(r"[^a-z0-9\s]+")
+_WS_RE = re.compile(r"\s+")
 
 def normalize_company(name: str) -> str:
     s = unicodedata.normalize("NFKD", (name or "")).lower()
     s = s.replace("&", " and ")
-    s = re.sub(r"[^a-z0-9\s]+", " ", s)          # strip punctuation
-    tokens = [t for t in s.split() if t not in {"the"}]
+    s = _PUNCT_RE.sub(" ", s)          # strip punctuation
+    tokens = [t for t in s.split() if t not in _STOP]
     # drop trailing legal suffixes
     while tokens and tokens[-1] in _SUFFIXES:
         tokens.pop()
     return " ".join(tokens)
 
+@lru_cache(maxsize=100_000)
 def company_key(name: str) -> str:
     n = normalize_company(name)
-    return re.sub(r"\s+", "-", n).strip("-")     # slug-like key
+    return _WS_RE.sub("-", n).strip("-")     # slug-like key
+
+def _slug_tokens(tokens) -> str:
+    tokens = [t for t in tokens if t not in _STOP]
+    while tokens and tokens[-1] in _SUFFIXES:
+        tokens.pop()
+    return "-".join(tokens)
+
+def company_keys(names):
+    """Vectorized company_key() over a pandas Series of company names."""
+    s = (
+        names.fillna("").astype(str)
+        .str.normalize("NFKD")
+        .str.lower()
+        .str.replace("&", " and ", regex=False)
+        .str.replace(_PUNCT_RE, " ", regex=True)
+    )
+    # Only the cheap token filtering stays per-row (no regex work in Python).
+    return s.str.split().map(_slug_tokens)
@@ -1,8 +1,9 @@
 # ──────────────────────────────────────────────────────────────────────────────
 # File: utils/validation.py
 # -----------------------------------------------------------------------------
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Iterator, Tuple
 from models import VALID_CATEGORIES, EMAIL_RE
+from utils.logging_utils import log
 
 REQUIRED = ["Company"]
 
@@ -30,3 +31,27 @@ def validate_row(row: Dict) -> Tuple[bool, str]:
         return False, f"Invalid Email format: {email}"
 
     return True, "OK"
+
+
+def validate_rows(rows: Iterable[Dict]) -> Iterator[Tuple[int, Dict]]:
+    """Batch form of validate_row: one lazy pass, cheapest check first.
+
+    Yields (index, row) for valid rows; rejects are logged as a warning (same
+    messages as validate_row) and skipped, so `rows` can be a generator.
+    """
+    match = EMAIL_RE.match
+    valid_cats = VALID_CATEGORIES
+    for i, row in enumerate(rows):
+        if not str(row.get("Company", "")).strip():
+            msg = "Missing required field: Company"
+        else:
+            cat = str(row.get("Category", "")).strip()
+            email = str(row.get("Email", "")).strip()
+            if cat and cat not in valid_cats:
+                msg = f"Invalid Category: {cat}"
+            elif email and not match(email):
+                msg = f"Invalid Email format: {email}"
+            else:
+                yield i, row
+                continue
+        log.warning("Skipping invalid row: %s — %s", msg, row)